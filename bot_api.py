@@ -3,12 +3,23 @@ Bot API Interface for Poker Tournament
 This defines the interface that all student bots must implement
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-from engine.cards import Card
+from typing import List, Dict, Optional, NamedTuple
+from itertools import combinations
+import random
+from engine.cards import Card, CARDS, HandEvaluator
 from engine.poker_game import GameState, PlayerAction
 import logging
 
 
+class ActionResult(NamedTuple):
+    """
+    A bot's decision: the action to take and, for raises, the total bet amount.
+    Unpacks like a plain (action, amount) tuple.
+    """
+    action: PlayerAction
+    amount: int
+
+
 class PokerBotAPI(ABC):
     """
     Abstract base class that all poker bots must inherit from.
@@ -21,7 +32,7 @@ class PokerBotAPI(ABC):
     
     @abstractmethod
     def get_action(self, game_state: GameState, hole_cards: List[Card], 
-                   legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
+                   legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> ActionResult:
         """
         Decide what action to take given the current game state.
         
@@ -33,15 +44,16 @@ class PokerBotAPI(ABC):
             max_bet: Maximum bet amount (your remaining chips + current bet)
         
         Returns:
-            tuple: (PlayerAction, amount)
+            ActionResult: (action, amount)
             - For FOLD, CHECK, CALL, ALL_IN: amount should be 0
             - For RAISE: amount should be the total bet amount (not additional amount)
+            A plain (PlayerAction, amount) tuple is also accepted.
         
         Examples:
-            return (PlayerAction.FOLD, 0)
-            return (PlayerAction.CALL, 0)  
-            return (PlayerAction.RAISE, 100)  # Raise to 100 total
-            return (PlayerAction.ALL_IN, 0)
+            return ActionResult(PlayerAction.FOLD, 0)
+            return ActionResult(PlayerAction.CALL, 0)
+            return ActionResult(PlayerAction.RAISE, 100)  # Raise to 100 total
+            return ActionResult(PlayerAction.ALL_IN, 0)
         """
         pass
     
@@ -186,6 +198,99 @@ class GameInfoAPI:
         """
         return game_state.player_chips.copy()
     
+    @staticmethod
+    def estimate_equity(hole_cards: List[Card], community_cards: List[Card],
+                        num_opponents: int, iterations: int = 1000) -> float:
+        """
+        Estimate your share of the pot against random opponent hands by
+        Monte Carlo simulation of the rest of the board.
+        
+        Args:
+            hole_cards: Your two hole cards
+            community_cards: Community cards dealt so far (0 to 5)
+            num_opponents: Number of opponents still in the hand
+            iterations: Number of simulated run-outs (1000 is usually plenty)
+            
+        Returns:
+            float: Expected fraction of the pot won, from 0.0 to 1.0 (ties split the pot)
+        """
+        if len(hole_cards) != 2 or len(community_cards) > 5:
+            raise ValueError("Need 2 hole cards and at most 5 community cards")
+        if iterations < 1:
+            raise ValueError("Need at least 1 iteration")
+        known = set(hole_cards) | set(community_cards)
+        if len(known) != len(hole_cards) + len(community_cards):
+            raise ValueError("Hole cards and community cards must all be different")
+        if num_opponents < 1:
+            return 1.0
+        if num_opponents == 1 and len(community_cards) == 5:
+            # Enumerating every opponent hand on the river is exact and faster
+            return GameInfoAPI.river_equity(hole_cards, community_cards)
+        
+        unseen = [card for card in CARDS if card not in known]
+        board_needed = 5 - len(community_cards)
+        draw_count = board_needed + 2 * num_opponents
+        if draw_count > len(unseen):
+            raise ValueError("Not enough cards left for that many opponents")
+        
+        hole_cards = list(hole_cards)
+        community_cards = list(community_cards)
+        evaluate7 = HandEvaluator.evaluate7
+        total = 0.0
+        for _ in range(iterations):
+            drawn = random.sample(unseen, draw_count)
+            board = community_cards + drawn[:board_needed]
+            my_rank = evaluate7(hole_cards + board)
+            
+            split = 1
+            for i in range(board_needed, draw_count, 2):
+                rank = evaluate7(drawn[i:i + 2] + board)
+                if rank < my_rank:
+                    break
+                if rank == my_rank:
+                    split += 1
+            else:
+                total += 1 / split
+        
+        return total / iterations
+    
+    @staticmethod
+    def river_equity(hole_cards: List[Card], community_cards: List[Card]) -> float:
+        """
+        Calculate your exact share of the pot on the river against one
+        opponent, by checking every hand the opponent could hold.
+        
+        Args:
+            hole_cards: Your two hole cards
+            community_cards: All 5 community cards
+            
+        Returns:
+            float: Fraction of the pot won, from 0.0 to 1.0 (ties split the pot)
+        """
+        if len(hole_cards) != 2 or len(community_cards) != 5:
+            raise ValueError("Need 2 hole cards and all 5 community cards")
+        
+        board = list(community_cards)
+        known = set(hole_cards) | set(board)
+        if len(known) != len(hole_cards) + len(board):
+            raise ValueError("Hole cards and community cards must all be different")
+        unseen = [card for card in CARDS if card not in known]
+        evaluate7 = HandEvaluator.evaluate7
+        my_rank = evaluate7(list(hole_cards) + board)
+        
+        wins = 0
+        ties = 0
+        opponent_hands = 0
+        for opponent_cards in combinations(unseen, 2):
+            rank = evaluate7(list(opponent_cards) + board)
+            if rank > my_rank:
+                wins += 1
+            elif rank == my_rank:
+                ties += 1
+            opponent_hands += 1
+        
+        return (wins + ties / 2) / opponent_hands
+    
     @staticmethod
     def format_cards(cards: List[Card]) -> str:
         """
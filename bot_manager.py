@@ -14,11 +14,15 @@ from typing import Dict, List, Optional, Any, Tuple
 from contextlib import contextmanager
 import logging
 
-from bot_api import PokerBotAPI, PlayerAction
+from bot_api import PokerBotAPI, PlayerAction, ActionResult
 from engine.cards import Card
 from engine.poker_game import GameState
 
 
+# Returned whenever a bot's action is replaced with a fold
+_FOLD = ActionResult(PlayerAction.FOLD, 0)
+
+
 class TimeoutException(Exception):
     """Exception raised when bot action times out"""
     pass
@@ -72,13 +76,13 @@ class BotWrapper:
                 self.timeout_count >= self.max_timeouts)
     
     def get_action(self, game_state: GameState, hole_cards: List[Card], 
-                   legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> Tuple[PlayerAction, int]:
+                   legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> ActionResult:
         """
         Get action from bot with timeout and error handling
         """
         if self.is_disqualified():
             self.logger.warning(f"Bot {self.name} is disqualified, folding automatically")
-            return PlayerAction.FOLD, 0
+            return _FOLD
         
         try:
             with timeout_context(self.timeout):
@@ -96,26 +100,26 @@ class BotWrapper:
                 # Ensure action is legal
                 if action not in legal_actions:
                     self.logger.warning(f"Bot {self.name} attempted illegal action {action}, folding instead")
-                    return PlayerAction.FOLD, 0
+                    return _FOLD
                 
                 # Validate amount for raises
                 if action == PlayerAction.RAISE:
                     if amount < min_bet or amount > max_bet:
                         self.logger.warning(f"Bot {self.name} attempted invalid raise amount {amount}, folding instead")
-                        return PlayerAction.FOLD, 0
+                        return _FOLD
                 
-                return action, amount
+                return ActionResult(action, amount)
                 
         except TimeoutException:
             self.timeout_count += 1
             self.logger.warning(f"Bot {self.name} timed out ({self.timeout_count}/{self.max_timeouts})")
-            return PlayerAction.FOLD, 0
+            return _FOLD
             
         except Exception as e:
             self.error_count += 1
             self.logger.error(f"Bot {self.name} error ({self.error_count}/{self.max_errors}): {str(e)}")
             self.logger.debug(traceback.format_exc())
-            return PlayerAction.FOLD, 0
+            return _FOLD
     
     def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
         """Notify bot of hand completion with error handling"""
@@ -2,9 +2,9 @@
 Poker card and deck management system
 """
 import random
+from array import array
 from enum import Enum
 from typing import List, Tuple, Optional
-from dataclasses import dataclass
 from itertools import combinations
 
 
@@ -31,53 +31,211 @@ class Rank(Enum):
     ACE = 14
 
 
-@dataclass
-class Card:
-    rank: Rank
-    suit: Suit
+# Cactus Kev card encoding, one int per card:
+#   bits 16-28: one-hot rank bit
+#   bits 12-15: one-hot suit bit
+#   bits 8-11:  rank index (0 = TWO ... 12 = ACE)
+#   bits 0-5:   rank prime
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {Suit.SPADES: 0x1, Suit.HEARTS: 0x2, Suit.DIAMONDS: 0x4, Suit.CLUBS: 0x8}
+
+_RANKS = tuple(Rank)
+_SUITS_BY_BIT = {bit: suit for suit, bit in SUIT_BITS.items()}
+_RANK_STRS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+
+
+class Card(int):
+    """A playing card, stored as its Cactus Kev integer encoding"""
+    __slots__ = ()
+
+    def __new__(cls, rank: Rank, suit: Suit):
+        r = rank.value - 2
+        return super().__new__(
+            cls, (1 << (16 + r)) | (SUIT_BITS[suit] << 12) | (r << 8) | RANK_PRIMES[r]
+        )
+
+    @property
+    def rank(self) -> Rank:
+        return _RANKS[(self >> 8) & 0xF]
+
+    @property
+    def suit(self) -> Suit:
+        return _SUITS_BY_BIT[(self >> 12) & 0xF]
+
+    def __getnewargs__(self):
+        return self.rank, self.suit
 
     def __str__(self) -> str:
-        rank_str = {
-            Rank.TWO: "2", Rank.THREE: "3", Rank.FOUR: "4", Rank.FIVE: "5",
-            Rank.SIX: "6", Rank.SEVEN: "7", Rank.EIGHT: "8", Rank.NINE: "9",
-            Rank.TEN: "10", Rank.JACK: "J", Rank.QUEEN: "Q", Rank.KING: "K", Rank.ACE: "A"
-        }
-        return f"{rank_str[self.rank]}{self.suit.value}"
+        return f"{_RANK_STRS[(self >> 8) & 0xF]}{self.suit.value}"
 
     def __repr__(self) -> str:
         return self.__str__()
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
 
-    def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+# Every card in the deck, keyed by its integer encoding
+CARDS = {card: card for card in (Card(rank, suit) for rank in Rank for suit in Suit)}
+
+
+# Encodings of all 52 cards in a fixed order
+_FULL_DECK = array('I', CARDS)
 
 
 class Deck:
     def __init__(self):
-        self.cards: List[Card] = []
-        self.reset()
+        self._cards: array = array('I', _FULL_DECK)
+        self._next = 0  # Index of the next card to deal
 
     def reset(self):
-        """Reset deck with all 52 cards"""
-        self.cards = [Card(rank, suit) for rank in Rank for suit in Suit]
+        """Return all 52 cards to the deck and shuffle it"""
+        # Start from a fixed order so the deal depends only on the random state
+        self._cards[:] = _FULL_DECK
+        random.shuffle(self._cards)
+        self._next = 0
 
     def shuffle(self):
-        """Shuffle the deck"""
-        random.shuffle(self.cards)
+        """Shuffle the cards remaining in the deck"""
+        remaining = self._cards[self._next:]
+        random.shuffle(remaining)
+        self._cards[self._next:] = remaining
 
     def deal_card(self) -> Optional[Card]:
         """Deal one card from the top of the deck"""
-        if self.cards:
-            return self.cards.pop()
+        if self._next < len(self._cards):
+            card = self._cards[self._next]
+            self._next += 1
+            return CARDS[card]
         return None
 
     def cards_remaining(self) -> int:
         """Get number of cards remaining in deck"""
-        return len(self.cards)
+        return len(self._cards) - self._next
+
+
+def _build_lookup_tables() -> Tuple[dict, dict]:
+    """
+    Build the Cactus Kev lookup tables mapping a 5-card hand to its rank
+    from 1 (royal flush) to 7462 (7-5-4-3-2 offsuit).
+    Returns: (flush_lookup, unsuited_lookup)
+    flush_lookup is keyed by the OR of the cards' rank bits,
+    unsuited_lookup by the product of the cards' rank primes.
+    """
+    flush_lookup = {}
+    unsuited_lookup = {}
+    ranks = range(12, -1, -1)  # Highest first
+
+    def prime_product(rank_bits: int) -> int:
+        product = 1
+        for r in range(13):
+            if rank_bits & (1 << r):
+                product *= RANK_PRIMES[r]
+        return product
+
+    # Straights from ace-high down to the wheel (5-4-3-2-A)
+    straights = [0b11111 << i for i in range(8, -1, -1)] + [0b1000000001111]
+    # Every other set of five distinct ranks, best first
+    high_cards = sorted(
+        (sum(1 << r for r in combo) for combo in combinations(range(13), 5)),
+        reverse=True
+    )
+    high_cards = [bits for bits in high_cards if bits not in straights]
+
+    rank = 1
+    for bits in straights:
+        flush_lookup[bits] = rank
+        rank += 1
+    for quad in ranks:
+        for kicker in ranks:
+            if kicker != quad:
+                unsuited_lookup[RANK_PRIMES[quad] ** 4 * RANK_PRIMES[kicker]] = rank
+                rank += 1
+    for trips in ranks:
+        for pair in ranks:
+            if pair != trips:
+                unsuited_lookup[RANK_PRIMES[trips] ** 3 * RANK_PRIMES[pair] ** 2] = rank
+                rank += 1
+    for bits in high_cards:
+        flush_lookup[bits] = rank
+        rank += 1
+    for bits in straights:
+        unsuited_lookup[prime_product(bits)] = rank
+        rank += 1
+    for trips in ranks:
+        kickers = [r for r in ranks if r != trips]
+        for k1, k2 in combinations(kickers, 2):
+            unsuited_lookup[RANK_PRIMES[trips] ** 3 * RANK_PRIMES[k1] * RANK_PRIMES[k2]] = rank
+            rank += 1
+    for high, low in combinations(ranks, 2):
+        for kicker in ranks:
+            if kicker != high and kicker != low:
+                unsuited_lookup[RANK_PRIMES[high] ** 2 * RANK_PRIMES[low] ** 2 * RANK_PRIMES[kicker]] = rank
+                rank += 1
+    for pair in ranks:
+        kickers = [r for r in ranks if r != pair]
+        for k1, k2, k3 in combinations(kickers, 3):
+            unsuited_lookup[RANK_PRIMES[pair] ** 2 * RANK_PRIMES[k1] * RANK_PRIMES[k2] * RANK_PRIMES[k3]] = rank
+            rank += 1
+    for bits in high_cards:
+        unsuited_lookup[prime_product(bits)] = rank
+        rank += 1
+
+    return flush_lookup, unsuited_lookup
+
+
+def _build_seven_card_tables(flush_lookup: dict, unsuited_lookup: dict) -> Tuple[dict, dict]:
+    """
+    Extend the 5-card tables to give the best rank of 7 cards directly.
+    Returns: (flush_lookup_7, unsuited_lookup_7)
+    flush_lookup_7 is keyed by the rank bits of 5 to 7 cards of one suit,
+    unsuited_lookup_7 by the product of all 7 cards' rank primes.
+    """
+    flush_lookup_7 = dict(flush_lookup)
+    flush_table = flush_lookup
+    unsuited_table = unsuited_lookup
+    for _ in range(2):
+        # Adding a card can only keep or improve the best rank
+        bigger_flush_table = {}
+        for rank_bits, rank in flush_table.items():
+            for r in range(13):
+                if not rank_bits & (1 << r):
+                    key = rank_bits | (1 << r)
+                    if rank < bigger_flush_table.get(key, rank + 1):
+                        bigger_flush_table[key] = rank
+        flush_lookup_7.update(bigger_flush_table)
+        flush_table = bigger_flush_table
+
+        bigger_unsuited_table = {}
+        for product, rank in unsuited_table.items():
+            for prime in RANK_PRIMES:
+                if product % prime ** 4:  # At most four cards of a rank
+                    key = product * prime
+                    if rank < bigger_unsuited_table.get(key, rank + 1):
+                        bigger_unsuited_table[key] = rank
+        unsuited_table = bigger_unsuited_table
+
+    return flush_lookup_7, unsuited_table
+
+
+_FLUSH_LOOKUP, _UNSUITED_LOOKUP = _build_lookup_tables()
+_FLUSH_LOOKUP_7, _UNSUITED_LOOKUP_7 = _build_seven_card_tables(_FLUSH_LOOKUP, _UNSUITED_LOOKUP)
+
+# Suit bit -> that suit's 4-bit counter, so summing over cards counts each suit
+_SUIT_COUNTERS = (0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000)
+# Overflow bit set when a suit's counter reaches 5 -> that suit's card bit
+_FLUSH_SUITS = {0x8: 0x1000, 0x80: 0x2000, 0x800: 0x4000, 0x8000: 0x8000}
+
+# Worst rank of each hand type, best type first
+_HAND_TYPE_RANK_LIMITS = (
+    (1, 'royal_flush'),
+    (10, 'straight_flush'),
+    (166, 'four_of_a_kind'),
+    (322, 'full_house'),
+    (1599, 'flush'),
+    (1609, 'straight'),
+    (2467, 'three_of_a_kind'),
+    (3325, 'two_pair'),
+    (6185, 'pair'),
+    (7462, 'high_card')
+)
 
 
 class HandEvaluator:
@@ -96,6 +254,63 @@ class HandEvaluator:
         'royal_flush': 10
     }
 
+    WORST_RANK = 7462
+
+    @staticmethod
+    def evaluate_rank(cards: List[Card]) -> int:
+        """
+        Rank the best 5-card hand that can be made from 5 or more cards.
+        Returns: 1 for a royal flush up to 7462 for the worst possible hand;
+        lower is better and equal ranks tie.
+        """
+        if len(cards) == 7:
+            return HandEvaluator.evaluate7(cards)
+
+        flush_lookup = _FLUSH_LOOKUP
+        unsuited_lookup = _UNSUITED_LOOKUP
+        best = HandEvaluator.WORST_RANK
+        for c1, c2, c3, c4, c5 in combinations(cards, 5):
+            if c1 & c2 & c3 & c4 & c5 & 0xF000:
+                rank = flush_lookup[(c1 | c2 | c3 | c4 | c5) >> 16]
+            else:
+                rank = unsuited_lookup[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+            if rank < best:
+                best = rank
+        return best
+
+    @staticmethod
+    def evaluate7(cards: List[Card]) -> int:
+        """
+        Rank the best 5-card hand from exactly 7 cards, as evaluate_rank does,
+        with one table lookup instead of scoring all 21 5-card subsets.
+        """
+        c0, c1, c2, c3, c4, c5, c6 = cards
+        suit_counters = _SUIT_COUNTERS
+        suit_counts = (suit_counters[(c0 >> 12) & 0xF] + suit_counters[(c1 >> 12) & 0xF] +
+                       suit_counters[(c2 >> 12) & 0xF] + suit_counters[(c3 >> 12) & 0xF] +
+                       suit_counters[(c4 >> 12) & 0xF] + suit_counters[(c5 >> 12) & 0xF] +
+                       suit_counters[(c6 >> 12) & 0xF])
+        flush = (suit_counts + 0x3333) & 0x8888
+        if flush:
+            # With 5+ cards of one suit, no quads or full house is possible,
+            # so the best hand is the best flush in that suit
+            suit_bit = _FLUSH_SUITS[flush]
+            rank_bits = 0
+            for card in cards:
+                if card & suit_bit:
+                    rank_bits |= card
+            return _FLUSH_LOOKUP_7[rank_bits >> 16]
+        return _UNSUITED_LOOKUP_7[(c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) *
+                                  (c4 & 0xFF) * (c5 & 0xFF) * (c6 & 0xFF)]
+
+    @staticmethod
+    def get_hand_type(rank: int) -> str:
+        """Get the hand type (a HAND_RANKINGS key) for a rank from evaluate_rank"""
+        for limit, hand_type in _HAND_TYPE_RANK_LIMITS:
+            if rank <= limit:
+                return hand_type
+        raise ValueError(f"Invalid hand rank: {rank}")
+
     @staticmethod
     def evaluate_hand(cards: List[Card]) -> Tuple[str, List[int]]:
         """
@@ -185,32 +400,11 @@ class HandEvaluator:
         if len(all_cards) < 5:
             raise ValueError("Must have at least 5 cards to evaluate.")
 
-        best_hand_combination = None
-        best_hand_type = ''
-        best_tiebreakers = []
-        best_rank = -1
-
-        for hand_combination in combinations(all_cards, 5):
-            hand_list = list(hand_combination)
-            hand_type, tiebreakers = HandEvaluator.evaluate_hand(hand_list)
-            rank = HandEvaluator.HAND_RANKINGS[hand_type]
-
-            if rank > best_rank:
-                best_rank = rank
-                best_hand_type = hand_type
-                best_tiebreakers = tiebreakers
-                best_hand_combination = hand_list
-            elif rank == best_rank:
-                # Compare tiebreakers for hands of the same rank
-                for i in range(len(tiebreakers)):
-                    if tiebreakers[i] > best_tiebreakers[i]:
-                        best_hand_type = hand_type
-                        best_tiebreakers = tiebreakers
-                        best_hand_combination = hand_list
-                        break
-                    elif tiebreakers[i] < best_tiebreakers[i]:
-                        break
-        
+        best_hand_combination = min(
+            (list(hand_combination) for hand_combination in combinations(all_cards, 5)),
+            key=HandEvaluator.evaluate_rank
+        )
+        best_hand_type, best_tiebreakers = HandEvaluator.evaluate_hand(best_hand_combination)
         return best_hand_type, best_tiebreakers, best_hand_combination
 
     @staticmethod
@@ -223,42 +417,15 @@ class HandEvaluator:
         if not player_hands:
             return []
 
-        best_hands = {}  # player_id -> (hand_type, tiebreakers)
-
-        for player_id, all_cards in player_hands:
-            hand_type, tiebreakers, _ = HandEvaluator.evaluate_best_hand(all_cards)
-            best_hands[player_id] = (hand_type, tiebreakers)
-
         winners = []
-        best_hand_so_far = None
+        best_rank = HandEvaluator.WORST_RANK + 1
 
-        for player_id, hand_info in best_hands.items():
-            if not best_hand_so_far:
-                best_hand_so_far = hand_info
+        for player_id, all_cards in player_hands:
+            rank = HandEvaluator.evaluate_rank(all_cards)
+            if rank < best_rank:
+                best_rank = rank
                 winners = [player_id]
-                continue
-
-            hand_rank = HandEvaluator.HAND_RANKINGS[hand_info[0]]
-            best_rank = HandEvaluator.HAND_RANKINGS[best_hand_so_far[0]]
+            elif rank == best_rank:
+                winners.append(player_id)
 
-            if hand_rank > best_rank:
-                best_hand_so_far = hand_info
-                winners = [player_id]
-            elif hand_rank == best_rank:
-                # Same hand type, compare tiebreakers
-                tiebreakers = hand_info[1]
-                best_tiebreakers = best_hand_so_far[1]
-                is_tie = True
-                for i in range(len(tiebreakers)):
-                    if tiebreakers[i] > best_tiebreakers[i]:
-                        best_hand_so_far = hand_info
-                        winners = [player_id]
-                        is_tie = False
-                        break
-                    elif tiebreakers[i] < best_tiebreakers[i]:
-                        is_tie = False
-                        break
-                if is_tie:
-                    winners.append(player_id)
-        
-        return winners
\ No newline at end of file
+        return winners
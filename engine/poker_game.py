@@ -1,15 +1,27 @@
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Mapping, Iterator
+from collections.abc import MutableMapping
+from dataclasses import dataclass, fields, replace
+from array import array
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
 from .cards import Card, Deck, HandEvaluator
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlayerHand:
+    __slots__ = ('cards',)
     cards: List[Card]
 
+    # Frozen dataclasses with __slots__ need these to be copied or pickled
+    def __getstate__(self):
+        return (self.cards,)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, 'cards', state[0])
+
 class PlayerAction(Enum):
     FOLD = 0
     CHECK = 1
@@ -17,27 +29,115 @@ class PlayerAction(Enum):
     RAISE = 3
     ALL_IN = 4
 
-@dataclass
+# Actions whose bit (1 << action.value) is set in each possible legal action mask
+_ACTIONS_BY_MASK = tuple(
+    tuple(action for action in PlayerAction if mask >> action.value & 1)
+    for mask in range(1 << len(PlayerAction))
+)
+
+@lru_cache(maxsize=4096)
+def _legal_action_mask(to_call: int, player_chips: int) -> int:
+    """
+    Get a player's legal actions as a bitmask over action values.
+    They depend only on these two amounts, which recur constantly, so results are cached.
+    """
+    legal_mask = 1 << PlayerAction.FOLD.value
+    if to_call == 0:
+        legal_mask |= 1 << PlayerAction.CHECK.value
+    elif player_chips >= to_call:
+        legal_mask |= 1 << PlayerAction.CALL.value
+    # Can raise if we have chips beyond the call amount
+    if player_chips > to_call:
+        legal_mask |= 1 << PlayerAction.RAISE.value
+    # Can always go all-in if we have chips
+    if player_chips > 0:
+        legal_mask |= 1 << PlayerAction.ALL_IN.value
+    return legal_mask
+
+@dataclass(frozen=True)
 class GameState:
+    """
+    Read-only view of the game handed to bots.
+
+    pot, current_bet and community_cards are fixed when the state is created,
+    but player_chips and player_bets are live read-only views of the engine's
+    values and keep changing as the hand goes on. Call snapshot() to get an
+    independent, mutable copy; deep copies and pickles are snapshots too.
+    """
+    __slots__ = ('pot', 'community_cards', 'current_bet', 'player_chips', 'player_bets',
+                 'active_players', 'current_player', 'round_name', 'min_bet',
+                 'big_blind', 'small_blind')
+
     pot: int
-    community_cards: List[Card]
+    community_cards: Tuple[Card, ...]
     current_bet: int
-    player_chips: Dict[str, int]
-    player_bets: Dict[str, int]
-    active_players: List[str]
+    player_chips: Mapping[str, int]
+    player_bets: Mapping[str, int]
+    active_players: Tuple[str, ...]
     current_player: str
     round_name: str
     min_bet: int
     big_blind: int
     small_blind: int
 
+    # The live views can't be pickled or deep-copied, so copy a snapshot instead
+    def __reduce__(self):
+        snapshot = self.snapshot()
+        return (GameState, tuple(getattr(snapshot, field.name) for field in fields(snapshot)))
+
+    def __deepcopy__(self, memo):
+        snapshot = self.snapshot()
+        memo[id(self)] = snapshot
+        return snapshot
+
+    def snapshot(self) -> 'GameState':
+        """Return a copy with plain lists and dicts that is safe to mutate"""
+        return replace(
+            self,
+            community_cards=list(self.community_cards),
+            player_chips=dict(self.player_chips),
+            player_bets=dict(self.player_bets),
+            active_players=list(self.active_players)
+        )
+
+class PlayerValues(MutableMapping):
+    """Dict-like view of a per-seat array, keyed by player id"""
+
+    def __init__(self, seats: Dict[str, int], values: array):
+        self._seats = seats
+        self._values = values
+
+    def __getitem__(self, player: str) -> int:
+        return self._values[self._seats[player]]
+
+    def __setitem__(self, player: str, value: int):
+        self._values[self._seats[player]] = value
+
+    def __delitem__(self, player: str):
+        raise TypeError("Players cannot be removed from the table")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._seats)
+
+    def __len__(self) -> int:
+        return len(self._seats)
+
+    def copy(self) -> Dict[str, int]:
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
 class PokerGame:
     """Manages a single hand of Texas Hold'em poker"""
     
     def __init__(self, players: Dict[str, any], starting_chips: int = 1000, 
                  small_blind: int = 10, big_blind: int = 20, dealer_button_index: int = 0):
         self.player_bots = players
+        self._bots = list(players.values())
         self.player_ids = list(players.keys())
+        # Each player's seat index; seat order is the order of player_ids
+        self._seats: Dict[str, int] = {player: seat for seat, player in enumerate(self.player_ids)}
         self.starting_chips = starting_chips
         self.small_blind = small_blind
         self.big_blind = big_blind
@@ -45,10 +145,24 @@ class PokerGame:
         # Game state
         self.deck = Deck()
         self.community_cards: List[Card] = []
-        self.player_hands: Dict[str, PlayerHand] = {}
-        self.player_chips: Dict[str, int] = {player: starting_chips for player in self.player_ids}
-        self.player_bets: Dict[str, int] = {player: 0 for player in self.player_ids}
-        self.active_players: List[str] = self.player_ids.copy()
+        # Hole cards of each seat, None until dealt
+        self._hands: List[Optional[PlayerHand]] = [None] * len(self.player_ids)
+        # Per-seat state is kept in arrays indexed by seat;
+        # player_chips and player_bets are views of them keyed by player id
+        self._chips = array('q', [starting_chips] * len(self.player_ids))
+        self._bets = array('q', [0] * len(self.player_ids))
+        # Chips each seat has put into the pot this hand, for splitting side pots
+        self._contribs = array('q', [0] * len(self.player_ids))
+        # Showdown hand rank of each seat (lower is better)
+        self._hand_ranks = array('H', [0] * len(self.player_ids))
+        self.player_chips = PlayerValues(self._seats, self._chips)
+        self.player_bets = PlayerValues(self._seats, self._bets)
+        # Bit i is set while the player in seat i is still in the hand
+        self._active_mask = (1 << len(self.player_ids)) - 1
+        self._active_count = len(self.player_ids)
+        self._current_seat = 0
+        # Legal actions of the player in _current_seat, as a bitmask over action values
+        self._legal_mask = 0
         self.folded_players: List[str] = []
         
         # Betting state
@@ -56,7 +170,12 @@ class PokerGame:
         self.current_bet = 0
         self.dealer_button = dealer_button_index
         self.round_name = "preflop"
-        self.players_acted = set()
+        # Bit i is set once seat i has acted since the last raise
+        self._acted_mask = 0
+        # Active players who are all-in, and those who need not act again
+        # this round (all-in, or acted since the last raise and matched it)
+        self._players_all_in = 0
+        self._players_settled = 0
 
         # Logging
         self.logger = logging.getLogger(__name__)
@@ -66,34 +185,34 @@ class PokerGame:
         self._start_hand()
 
         # Pre-flop betting
-        if len(self.active_players) > 1:
+        if self._active_count > 1:
             self.logger.info("\n--- PRE-FLOP BETTING ---")
             self._run_betting_round()
             self._log_round_summary()
 
         # Flop
-        if len(self.active_players) > 1:
+        if self._active_count > 1:
             self.advance_to_next_round()
             self.logger.info("\n--- FLOP BETTING ---")
             self._run_betting_round()
             self._log_round_summary()
 
         # Turn
-        if len(self.active_players) > 1:
+        if self._active_count > 1:
             self.advance_to_next_round()
             self.logger.info("\n--- TURN BETTING ---")
             self._run_betting_round()
             self._log_round_summary()
 
         # River
-        if len(self.active_players) > 1:
+        if self._active_count > 1:
             self.advance_to_next_round()
             self.logger.info("\n--- RIVER BETTING ---")
             self._run_betting_round()
             self._log_round_summary()
 
         # Showdown
-        if len(self.active_players) > 1:
+        if self._active_count > 1:
             self.logger.info("\n--- SHOWDOWN ---")
             winners = self.determine_winners()
             self._distribute_pot(winners)
@@ -107,140 +226,158 @@ class PokerGame:
         
         return self.player_chips
 
+    @property
+    def active_players(self) -> List[str]:
+        """Players still in the hand, in seat order"""
+        mask = self._active_mask
+        return [player for seat, player in enumerate(self.player_ids) if mask >> seat & 1]
+
+    @property
+    def player_hands(self) -> Dict[str, PlayerHand]:
+        """Hole cards of each player dealt into the hand"""
+        return {player: hand for player, hand in zip(self.player_ids, self._hands) if hand is not None}
+
+    def _active_seats(self) -> List[int]:
+        """Seats still in the hand, in seat order"""
+        mask = self._active_mask
+        return [seat for seat in range(len(self.player_ids)) if mask >> seat & 1]
+
+    def _next_active_seat(self, seat: int) -> int:
+        """Get the first active seat after the given one, wrapping around the table"""
+        mask = self._active_mask
+        later = mask >> (seat + 1)
+        if later:
+            return seat + (later & -later).bit_length()
+        return (mask & -mask).bit_length() - 1
+
     def _start_hand(self):
         """Start a new hand of poker"""
         self.reset_hand()
         self.deal_hole_cards()
         self.post_blinds()
         
-        self.logger.info(f"\n{'='*30}\n--- NEW HAND ---")
-        self.logger.info(f"Dealer: {self.player_ids[self.dealer_button]}")
-        for p_id in self.active_players:
-            self.logger.info(f"{p_id} has {self.player_hands[p_id]} (chips: {self.player_chips[p_id]})")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("\n%s\n--- NEW HAND ---", '=' * 30)
+            self.logger.info("Dealer: %s", self.player_ids[self.dealer_button])
+            for seat in self._active_seats():
+                self.logger.info("%s has %s (chips: %d)", self.player_ids[seat], self._hands[seat], self._chips[seat])
     
     def reset_hand(self):
         """Reset for a new hand"""
-        self.deck = Deck()
-        self.deck.shuffle()
-        self.community_cards = []
-        self.player_hands = {}
-        self.active_players = [p for p in self.player_ids if self.player_chips[p] > 0]
-        self.player_bets = {player: 0 for player in self.player_ids}
-        self.folded_players = []
+        # Reuse this game's deck and containers rather than reallocating them
+        self.deck.reset()
+        self.community_cards.clear()
+        self._active_mask = 0
+        self._active_count = 0
+        for seat, chips in enumerate(self._chips):
+            if chips > 0:
+                self._active_mask |= 1 << seat
+                self._active_count += 1
+            self._bets[seat] = 0
+            self._hands[seat] = None
+            self._contribs[seat] = 0
+            self._hand_ranks[seat] = 0
+        self.folded_players.clear()
         self.pot = 0
         self.current_bet = self.big_blind
         self.round_name = "preflop"
     
     def deal_hole_cards(self):
         """Deal 2 cards to each active player"""
-        for player in self.active_players:
+        for seat in self._active_seats():
             cards = [self.deck.deal_card() for _ in range(2)]
-            self.player_hands[player] = PlayerHand(cards)
+            self._hands[seat] = PlayerHand(cards)
     
     def post_blinds(self):
         """Post small and big blinds"""
-        if len(self.active_players) < 2:
+        if self._active_count < 2:
             return
         
         # Determine the players who post blinds relative to the dealer
-        # Find the index of the current dealer within the active players list
-        try:
-            dealer_active_index = self.active_players.index(self.player_ids[self.dealer_button])
-        except ValueError:
-            # Dealer might have been eliminated, find next active player as nominal dealer
-            for i in range(len(self.player_ids)):
-                potential_dealer_index = (self.dealer_button + i) % len(self.player_ids)
-                potential_dealer = self.player_ids[potential_dealer_index]
-                if potential_dealer in self.active_players:
-                    self.dealer_button = potential_dealer_index # Update actual dealer button
-                    dealer_active_index = self.active_players.index(potential_dealer)
-                    break
-            else: # Should not happen if len(self.active_players) >= 1
-                return # No active dealer found (e.g., all players eliminated)
+        if not self._active_mask >> self.dealer_button & 1:
+            # Dealer might have been eliminated, move the button to the next active player
+            self.dealer_button = self._next_active_seat(self.dealer_button)
         
-        if len(self.active_players) == 2:
+        if self._active_count == 2:
             # Heads-up: Dealer is small blind, non-dealer is big blind
-            small_blind_player = self.active_players[dealer_active_index]
-            big_blind_player = self.active_players[(dealer_active_index + 1) % 2]
+            small_blind_seat = self.dealer_button
         else:
             # Normal play: Small blind is left of dealer, big blind is left of small blind
-            small_blind_player = self.active_players[(dealer_active_index + 1) % len(self.active_players)]
-            big_blind_player = self.active_players[(dealer_active_index + 2) % len(self.active_players)]
+            small_blind_seat = self._next_active_seat(self.dealer_button)
+        big_blind_seat = self._next_active_seat(small_blind_seat)
+        small_blind_player = self.player_ids[small_blind_seat]
+        big_blind_player = self.player_ids[big_blind_seat]
         
         # Post small blind
-        small_blind_amount = min(self.small_blind, self.player_chips[small_blind_player])
-        self.player_bets[small_blind_player] = small_blind_amount
-        self.player_chips[small_blind_player] -= small_blind_amount
+        small_blind_amount = min(self.small_blind, self._chips[small_blind_seat])
+        self._bets[small_blind_seat] = small_blind_amount
+        self._chips[small_blind_seat] -= small_blind_amount
         self.pot += small_blind_amount
+        self._contribs[small_blind_seat] += small_blind_amount
         
         # Post big blind
-        big_blind_amount = min(self.big_blind, self.player_chips[big_blind_player])
-        self.player_bets[big_blind_player] = big_blind_amount
-        self.player_chips[big_blind_player] -= big_blind_amount
+        big_blind_amount = min(self.big_blind, self._chips[big_blind_seat])
+        self._bets[big_blind_seat] = big_blind_amount
+        self._chips[big_blind_seat] -= big_blind_amount
         self.pot += big_blind_amount
+        self._contribs[big_blind_seat] += big_blind_amount
         
-        self.logger.info(f"{small_blind_player} posts small blind: {small_blind_amount}")
-        self.logger.info(f"{big_blind_player} posts big blind: {big_blind_amount}")
+        self.logger.info("%s posts small blind: %d", small_blind_player, small_blind_amount)
+        self.logger.info("%s posts big blind: %d", big_blind_player, big_blind_amount)
 
     def _run_betting_round(self):
         self._start_betting_round()
-        
+
+        # Look these up once per round rather than once per action
+        bots = self._bots
+        hands = self._hands
+        chips = self._chips
+        bets = self._bets
+        big_blind = self.big_blind
+        
+        # The round is always complete once fewer than two players remain,
+        # so there is a current player whenever the loop runs
         while not self.is_betting_round_complete():
-            player_id = self.get_current_player()
-            if not player_id:
-                break
-            
-            bot = self.player_bots[player_id]
+            seat = self._current_seat
             game_state = self.get_game_state()
-            player_hand = self.get_player_hand(player_id)
-            legal_actions = self.get_legal_actions(game_state, player_id)
-            min_bet = game_state.current_bet + game_state.big_blind
-            max_bet = self.player_chips[player_id] + self.player_bets[player_id]
+            legal_actions = self.get_current_legal_actions()
+            min_bet = self.current_bet + big_blind
+            max_bet = chips[seat] + bets[seat]
 
-            action, amount = bot.get_action(game_state, player_hand.cards, legal_actions, min_bet, max_bet)
+            action, amount = bots[seat].get_action(
+                game_state, hands[seat].cards, legal_actions, min_bet, max_bet)
             
-            self.process_action(player_id, action, amount)
+            self._process_action(seat, action, amount)
             self.advance_to_next_player()
 
     def _start_betting_round(self):
         """Resets betting state for a new round."""
-        self.players_acted = set()
-        # Find the index of the current dealer within the active players list
-        try:
-            dealer_active_index = self.active_players.index(self.player_ids[self.dealer_button])
-        except ValueError:
-            # Dealer might have been eliminated, find next active player as nominal dealer
-            for i in range(len(self.player_ids)):
-                potential_dealer_index = (self.dealer_button + i) % len(self.player_ids)
-                potential_dealer = self.player_ids[potential_dealer_index]
-                if potential_dealer in self.active_players:
-                    self.dealer_button = potential_dealer_index # Update actual dealer button
-                    dealer_active_index = self.active_players.index(potential_dealer)
-                    break
-            else: # Should not happen if len(self.active_players) >= 1
-                dealer_active_index = 0 # Default to first active player if no valid dealer is found (shouldn't happen with >=1 active)
-
-        self.current_player_index = (dealer_active_index + 1) % len(self.active_players)
+        self._acted_mask = 0
         if self.round_name != "preflop":
              self.current_bet = 0
-             for p in self.player_ids:
-                self.player_bets[p] = 0
+             for seat in range(len(self._bets)):
+                self._bets[seat] = 0
+        # Action starts with the first active player left of the dealer
+        self._set_current_seat(self._next_active_seat(self.dealer_button))
+        self._players_all_in = sum(1 for seat, chips in enumerate(self._chips)
+                                   if chips == 0 and self._active_mask >> seat & 1)
+        self._players_settled = self._players_all_in
         
     def get_current_player(self) -> str:
         """Get the current player to act"""
-        if not self.active_players:
+        if not self._active_mask:
             return ""
-        return self.active_players[self.current_player_index % len(self.active_players)]
+        return self.player_ids[self._current_seat]
     
     def get_game_state(self) -> GameState:
         """Get the current game state visible to players"""
         return GameState(
             pot=self.pot,
-            community_cards=self.community_cards.copy(),
+            community_cards=tuple(self.community_cards),
             current_bet=self.current_bet,
-            player_chips=self.player_chips.copy(),
-            player_bets=self.player_bets.copy(),
-            active_players=self.active_players.copy(),
+            player_chips=MappingProxyType(self.player_chips),
+            player_bets=MappingProxyType(self.player_bets),
+            active_players=tuple(self.active_players),
             current_player=self.get_current_player(),
             round_name=self.round_name,
             min_bet=self.big_blind, # Simplified, should be based on previous raise
@@ -250,7 +387,8 @@ class PokerGame:
     
     def get_player_hand(self, player: str) -> Optional[PlayerHand]:
         """Get a player's hole cards"""
-        return self.player_hands.get(player)
+        seat = self._seats.get(player)
+        return None if seat is None else self._hands[seat]
     
     def validate_action(self, action: PlayerAction, amount: int, game_state: GameState, 
                    player_name: str) -> bool:
@@ -294,92 +432,138 @@ class PokerGame:
 
     def process_action(self, player: str, action: PlayerAction, amount: int = 0):
         """Process a player's action"""
-        if not self.validate_action(action, amount, self.get_game_state(), player):
+        self._process_action(self._seats[player], action, amount)
+
+    def _is_legal_action(self, seat: int, action: PlayerAction, amount: int) -> bool:
+        """Same check as validate_action, using the cached legal actions of the seat to act"""
+        if seat != self._current_seat or not self._active_mask >> seat & 1:
+            return False
+        if not self._legal_mask >> action.value & 1:
+            return False
+        if action == PlayerAction.RAISE:
+            return (amount >= self.current_bet + self.big_blind and
+                    self._chips[seat] >= amount - self._bets[seat] and
+                    amount > self.current_bet)
+        return True
+
+    def _process_action(self, seat: int, action: PlayerAction, amount: int = 0):
+        """Process the action of the player in a seat"""
+        player = self.player_ids[seat]
+        # Chips and bets are stored in integer arrays, so convert before changing any state
+        amount = int(amount)
+        if not self._is_legal_action(seat, action, amount):
             # Default to fold if action is invalid
-            self.logger.warning(f"Bot {player} attempted illegal action {action.name}, folding.")
+            self.logger.warning("Bot %s attempted illegal action %s, folding.", player, action.name)
             action = PlayerAction.FOLD
             amount = 0
         
-        self.players_acted.add(player)
-        player_bet = self.player_bets[player]
-        to_call = self.current_bet - player_bet
+        seat_bit = 1 << seat
+        chips = self._chips
+        bets = self._bets
+        was_all_in = chips[seat] == 0
+        was_settled = self._is_settled(seat)
+        previous_bet = self.current_bet
+
+        self._acted_mask |= seat_bit
+        to_call = self.current_bet - bets[seat]
         
         if action == PlayerAction.FOLD:
             self.folded_players.append(player)
-            if player in self.active_players:
-                self.active_players.remove(player)
-            self.logger.info(f"  {player} folds")
+            if self._active_mask & seat_bit:
+                self._active_mask &= ~seat_bit
+                self._active_count -= 1
+            self.logger.info("  %s folds", player)
         
         elif action == PlayerAction.CHECK:
-            self.logger.info(f"  {player} checks")
+            self.logger.info("  %s checks", player)
         
         elif action == PlayerAction.CALL:
-            call_amount = min(to_call, self.player_chips[player])
-            self.player_bets[player] += call_amount
-            self.player_chips[player] -= call_amount
+            call_amount = min(to_call, chips[seat])
+            bets[seat] += call_amount
+            chips[seat] -= call_amount
             self.pot += call_amount
-            self.logger.info(f"  {player} calls {call_amount}")
+            self._contribs[seat] += call_amount
+            self.logger.info("  %s calls %d", player, call_amount)
         
         elif action == PlayerAction.RAISE:
             raise_total = amount
-            raise_amount = raise_total - self.player_bets[player]
+            raise_amount = raise_total - bets[seat]
 
-            if self.player_chips[player] <= raise_amount:
+            if chips[seat] <= raise_amount:
                 # Player does not have enough chips, it's an all-in
-                raise_amount = self.player_chips[player]
+                raise_amount = chips[seat]
                 action = PlayerAction.ALL_IN
 
-            self.player_bets[player] += raise_amount
-            self.player_chips[player] -= raise_amount
+            bets[seat] += raise_amount
+            chips[seat] -= raise_amount
             self.pot += raise_amount
+            self._contribs[seat] += raise_amount
             
             if action == PlayerAction.ALL_IN:
-                self.logger.info(f"  {player} goes all-in with {raise_amount}")
-                if self.player_bets[player] > self.current_bet:
-                    self.current_bet = self.player_bets[player]
-                    self.players_acted.clear()
+                self.logger.info("  %s goes all-in with %d", player, raise_amount)
+                if bets[seat] > self.current_bet:
+                    self.current_bet = bets[seat]
+                    self._acted_mask = seat_bit
             else:
-                self.current_bet = self.player_bets[player]
-                self.logger.info(f"  {player} raises to {self.current_bet}")
-                self.players_acted.clear() 
-            self.players_acted.add(player)
+                self.current_bet = bets[seat]
+                self.logger.info("  %s raises to %d", player, self.current_bet)
+                self._acted_mask = seat_bit
 
 
         elif action == PlayerAction.ALL_IN:
-            all_in_amount = self.player_chips[player]
-            self.player_bets[player] += all_in_amount
-            self.player_chips[player] = 0
+            all_in_amount = chips[seat]
+            bets[seat] += all_in_amount
+            chips[seat] = 0
             self.pot += all_in_amount
-            new_bet = self.player_bets[player]
+            self._contribs[seat] += all_in_amount
+            new_bet = bets[seat]
             if new_bet > self.current_bet:
                 self.current_bet = new_bet
-                self.players_acted.clear() 
-            self.players_acted.add(player)
-            self.logger.info(f"  {player} goes all-in for {all_in_amount}")
+                self._acted_mask = seat_bit
+            self.logger.info("  %s goes all-in for %d", player, all_in_amount)
+
+        self._update_settled_count(seat, action, was_all_in, was_settled, previous_bet)
+
+    def _is_settled(self, seat: int) -> bool:
+        """Check if an active seat needs no further action this round"""
+        return (self._chips[seat] == 0 or
+                (self._acted_mask >> seat & 1 == 1 and self._bets[seat] == self.current_bet))
+
+    def _update_settled_count(self, seat: int, action: PlayerAction, was_all_in: bool,
+                              was_settled: bool, previous_bet: int):
+        """Keep the all-in and settled counts current after a player's action"""
+        if action == PlayerAction.FOLD:
+            self._players_all_in -= was_all_in
+            self._players_settled -= was_settled
+            return
+
+        is_all_in = self._chips[seat] == 0
+        self._players_all_in += is_all_in - was_all_in
+        if self.current_bet > previous_bet:
+            # A raise reopens the action for everyone but the raiser and all-in players
+            self._players_settled = self._players_all_in + (not is_all_in)
+        else:
+            self._players_settled += self._is_settled(seat) - was_settled
     
     def advance_to_next_player(self):
         """Move to the next player"""
-        if not self.active_players:
+        if not self._active_mask:
             return
-        self.current_player_index = (self.current_player_index + 1) % len(self.active_players)
+        self._set_current_seat(self._next_active_seat(self._current_seat))
+
+    def _set_current_seat(self, seat: int):
+        """Hand the action to a seat and work out that player's legal actions"""
+        self._current_seat = seat
+        self._legal_mask = _legal_action_mask(self.current_bet - self._bets[seat], self._chips[seat])
+
+    def get_current_legal_actions(self) -> List[PlayerAction]:
+        """Get the legal actions of the player currently to act"""
+        return list(_ACTIONS_BY_MASK[self._legal_mask])
     
     def is_betting_round_complete(self) -> bool:
         """Check if the current betting round is complete"""
-        if len(self.active_players) <= 1:
-            return True
-        
-        # All non-all-in players have had a chance to act
-        non_all_in_players = [p for p in self.active_players if self.player_chips[p] > 0]
-        if not self.players_acted.issuperset(non_all_in_players):
-            return False
-
-        # All non-folded, non-all-in players have the same amount bet
-        max_bet = self.current_bet
-        for player in non_all_in_players:
-            if self.player_bets[player] != max_bet:
-                return False
-        
-        return True
+        return (self._active_count <= 1 or
+                self._players_settled == self._active_count)
     
     def advance_to_next_round(self):
         """Advance to the next betting round"""
@@ -400,56 +584,101 @@ class PokerGame:
         self.deck.deal_card()  # Burn card
         for _ in range(3):
             self.community_cards.append(self.deck.deal_card())
-        self.logger.info(f"FLOP: [{', '.join(map(str, self.community_cards))}]")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("FLOP: [%s]", ', '.join(map(str, self.community_cards)))
     
     def deal_turn(self):
         """Deal the turn (4th community card)"""
         self.deck.deal_card()  # Burn card
         self.community_cards.append(self.deck.deal_card())
-        self.logger.info(f"TURN: {self.community_cards[-1]}")
+        self.logger.info("TURN: %s", self.community_cards[-1])
     
     def deal_river(self):
         """Deal the river (5th community card)"""
         self.deck.deal_card()  # Burn card
         self.community_cards.append(self.deck.deal_card())
-        self.logger.info(f"RIVER: {self.community_cards[-1]}")
+        self.logger.info("RIVER: %s", self.community_cards[-1])
     
     def determine_winners(self) -> List[str]:
         """Determine winners using HandEvaluator"""
-        if len(self.active_players) == 1:
+        if self._active_count == 1:
             return self.active_players
         
-        player_hands_to_evaluate = []
-        for player_id in self.active_players:
-            hole_cards = self.player_hands[player_id].cards
+        # Rank each hand once and use that rank for both the log and the result
+        winners = []
+        best_rank = HandEvaluator.WORST_RANK + 1
+        log_hands = self.logger.isEnabledFor(logging.INFO)
+        for seat in self._active_seats():
+            player_id = self.player_ids[seat]
+            hole_cards = self._hands[seat].cards
             all_cards = hole_cards + self.community_cards
-            player_hands_to_evaluate.append((player_id, all_cards))
-            
-            best_hand_type, _, best_5_cards = HandEvaluator.evaluate_best_hand(all_cards)
-            self.logger.info(f"  {player_id}: Hand: {hole_cards} -> {best_hand_type} [{', '.join(map(str, best_5_cards))}]")
+            rank = HandEvaluator.evaluate_rank(all_cards)
+            self._hand_ranks[seat] = rank
+            if rank < best_rank:
+                best_rank = rank
+                winners = [player_id]
+            elif rank == best_rank:
+                winners.append(player_id)
+
+            if log_hands:
+                _, _, best_5_cards = HandEvaluator.evaluate_best_hand(all_cards)
+                self.logger.info("  %s: Hand: %s -> %s [%s]", player_id, hole_cards,
+                                 HandEvaluator.get_hand_type(rank), ', '.join(map(str, best_5_cards)))
 
-        winners = HandEvaluator.get_winners(player_hands_to_evaluate)
-        self.logger.info(f"WINNERS: {', '.join(winners)}")
+        if log_hands:
+            self.logger.info("WINNERS: %s", ', '.join(winners))
         return winners
     
     def _distribute_pot(self, winners: List[str]):
-        """Distribute the pot among the winners"""
+        """
+        Distribute the pot among the winners, splitting it into side pots
+        when players are all-in for different amounts
+        """
         if not winners:
             return
         
-        # For now, simple pot splitting. Side pots are not handled.
-        winnings_per_player = self.pot // len(winners)
-        for winner in winners:
-            self.player_chips[winner] += winnings_per_player
-            self.logger.info(f"{winner} wins {winnings_per_player}")
+        contribs = self._contribs
+        hand_ranks = self._hand_ranks
+        num_seats = len(self.player_ids)
+        # Seats from the lowest contribution up; each distinct contribution level
+        # closes a pot that only players who put in at least that much can win
+        order = sorted(range(num_seats), key=contribs.__getitem__)
+        winnings = [0] * num_seats
+        pot_winners = [self._seats[winner] for winner in winners]
+        level = 0
+        for i, seat in enumerate(order):
+            if contribs[seat] == level:
+                continue
+            pot = (contribs[seat] - level) * (num_seats - i)
+            level = contribs[seat]
+            
+            eligible = [s for s in order[i:] if self._active_mask >> s & 1]
+            if eligible:
+                best_rank = min(hand_ranks[s] for s in eligible)
+                pot_winners = [s for s in eligible if hand_ranks[s] == best_rank]
+            # Otherwise everyone who put this much in has folded, and the
+            # chips go to the winners of the pot below
+            
+            # Odd chips go to the first winners left of the dealer
+            pot_winners.sort(key=lambda s: (s - self.dealer_button - 1) % num_seats)
+            share, odd_chips = divmod(pot, len(pot_winners))
+            for j, winner_seat in enumerate(pot_winners):
+                winnings[winner_seat] += share + (j < odd_chips)
+        
+        for seat, amount in enumerate(winnings):
+            if amount:
+                self._chips[seat] += amount
+                self.logger.info("%s wins %d", self.player_ids[seat], amount)
         
         # Clear pot after distribution
         self.pot = 0
 
     def _log_round_summary(self):
         """Logs a summary of the current round."""
-        self.logger.info(f"Community Cards: [{', '.join(map(str, self.community_cards))}]")
-        self.logger.info(f"Pot: {self.pot}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Community Cards: [%s]", ', '.join(map(str, self.community_cards)))
+        self.logger.info("Pot: %d", self.pot)
         self.logger.info("-" * 20)
 
     def get_legal_actions(self, game_state: GameState, player_name: str) -> List[PlayerAction]:
@@ -471,20 +700,4 @@ class PokerGame:
         player_bet = game_state.player_bets[player_name]
         to_call = game_state.current_bet - player_bet
         
-        legal_actions = [PlayerAction.FOLD]
-        
-        if to_call == 0:
-            legal_actions.append(PlayerAction.CHECK)
-        else:
-            if player_chips >= to_call:
-                legal_actions.append(PlayerAction.CALL)
-        
-        # Can raise if we have chips beyond the call amount
-        if player_chips > to_call:
-            legal_actions.append(PlayerAction.RAISE)
-        
-        # Can always go all-in if we have chips
-        if player_chips > 0:
-            legal_actions.append(PlayerAction.ALL_IN)
-        
-        return legal_actions
\ No newline at end of file
+        return list(_ACTIONS_BY_MASK[_legal_action_mask(to_call, player_chips)])
@@ -65,7 +65,7 @@ class AggressiveBot(PokerBotAPI):
     def _postflop_strategy(self, game_state: GameState, hole_cards: List[Card], 
                            legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
         """Aggressive post-flop strategy"""
-        all_cards = hole_cards + game_state.community_cards
+        all_cards = list(hole_cards) + list(game_state.community_cards)
         hand_type, _, _ = HandEvaluator.evaluate_best_hand(all_cards)
         hand_rank = HandEvaluator.HAND_RANKINGS[hand_type]
 